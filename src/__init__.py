@@ -1,5 +1,5 @@
 """Persona-based behavioral simulation agents."""
 
-from .agents import PersonaAgent, PersonaSimulator
+from .agents import PersonaAgent, PersonaSimulator, ResponseCache
 
-__all__ = ["PersonaAgent", "PersonaSimulator"]
+__all__ = ["PersonaAgent", "PersonaSimulator", "ResponseCache"]
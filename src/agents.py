@@ -7,13 +7,21 @@ that simulate customer behavior based on empirically-derived personas.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import logging
 import os
+import re
+import sys
+import threading
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 try:
     import anthropic
@@ -21,8 +29,211 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+# Errors left after the client's own retries. Transient ones (see
+# _is_transient) are recorded as "Error" results instead of aborting a batch
+_API_ERRORS = (
+    (anthropic.APIStatusError, anthropic.APIConnectionError)
+    if ANTHROPIC_AVAILABLE else ()
+)
 
-@dataclass
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+logger = logging.getLogger(__name__)
+
+# Client retry policy: retries back off exponentially on 429/5xx and timeouts
+_MAX_RETRIES = 5
+_TIMEOUT = 60.0
+
+# Explicit decision markers (handles markdown bold, brackets, etc.)
+# Matches: "DECISION: Yes", "**DECISION:** No", "DECISION: [Maybe]", etc.
+_DECISION_RE = re.compile(r'\*{0,2}decision\*{0,2}[:\s]+\[?(\w+)\]?', re.IGNORECASE)
+# Decision markers appear near the start of a response, so only this many
+# leading characters are searched
+_DECISION_SEARCH_CHARS = 400
+_YES = frozenset({"yes", "y"})
+_NO = frozenset({"no", "n"})
+_MAYBE = frozenset({"maybe", "uncertain", "unsure"})
+# Fallback keywords: group 1 is a "yes" phrase, group 2 a "no" phrase
+_FALLBACK_RE = re.compile(
+    r"(i would buy|i'll take|yes,)|(i would not|i wouldn't|no,)",
+    re.IGNORECASE
+)
+
+# Result DataFrame columns, in output order
+_RESULT_COLUMNS = ("cluster_id", "persona_name", "decision", "response")
+_BATCH_COLUMNS = _RESULT_COLUMNS + ("scenario_name",)
+
+# dataclass(slots=True) requires Python 3.10+; older versions keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Whether an API error could succeed on a later attempt.
+
+    Connection errors and the statuses the SDK itself retries (408, 409,
+    429, 5xx) are transient. Others, such as an invalid API key (401) or
+    unknown model (404), are configuration mistakes that every call repeats.
+    """
+    status = getattr(error, "status_code", None)
+    return status is None or status in (408, 409, 429) or status >= 500
+
+
+def _run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Falls back to a new event loop on a worker thread when one is already
+    running (e.g. inside Jupyter), where asyncio.run() is not allowed. If
+    the caller is interrupted while waiting, the coroutine is cancelled so
+    its in-flight calls stop, and the interrupt is re-raised once it exits.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    loop = asyncio.new_event_loop()
+    task = loop.create_task(coro)
+
+    def _run_loop():
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(task)
+        except BaseException:
+            # Retrieved by the caller through task.result()
+            pass
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    thread = threading.Thread(target=_run_loop, daemon=True)
+    thread.start()
+    try:
+        thread.join()
+    except BaseException:
+        try:
+            loop.call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            # The loop already finished and closed
+            pass
+        thread.join()
+        raise
+
+    return task.result()
+
+
+async def _cancel_and_wait(tasks: list[asyncio.Task]) -> None:
+    """Cancel unfinished tasks and wait for them, retrieving any exceptions."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _gather_or_cancel(coros: list) -> list:
+    """
+    Like asyncio.gather(), but if one call fails or the caller is cancelled,
+    cancel the rest so none outlive the client they are using.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        await _cancel_and_wait(tasks)
+
+
+def _append_row(columns: dict[str, list], values) -> None:
+    """Append one row's values, given in column order, to the column lists."""
+    for column, value in zip(columns.values(), values):
+        column.append(value)
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    """Read records from a JSON lines file, skipping unreadable lines."""
+    records = []
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                records.append(_loads(line))
+            except json.JSONDecodeError:
+                # Skip blank lines and a truncated final write
+                continue
+    return records
+
+
+def _terminate_last_line(path: Path) -> None:
+    """Append a newline if a previous writer was interrupted mid-line."""
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+
+class ResponseCache:
+    """
+    On-disk cache of agent responses, stored as JSON lines.
+
+    Entries are keyed on (system_prompt, scenario, model, max_tokens) and
+    appended to the file as soon as they are received, so responses
+    collected before an interrupted run are reused by the next one.
+    """
+
+    def __init__(self, path: str | Path = None):
+        """
+        Initialize the cache, loading any existing entries.
+
+        Args:
+            path: Path to the JSONL cache file. If None, uses default location.
+        """
+        if path is None:
+            # Default path relative to this file
+            path = Path(__file__).parent.parent / "data/cache/responses.jsonl"
+
+        self.path = Path(path)
+        self._entries: dict[str, str] = {}
+
+        if self.path.exists():
+            _terminate_last_line(self.path)
+            for entry in _read_jsonl(self.path):
+                self._entries[entry["key"]] = entry["response"]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        system_prompt: str,
+        scenario: str,
+        model: str,
+        max_tokens: int
+    ) -> str:
+        """Build the cache key for a (system_prompt, scenario, model, max_tokens) call."""
+        raw = f"{system_prompt}\x00{scenario}\x00{model}\x00{max_tokens}".encode("utf-8")
+        return hashlib.blake2b(raw).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for key, or None on a miss."""
+        return self._entries.get(key)
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response and append it to the cache file."""
+        self._entries[key] = response
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"key": key, "response": response}) + "\n")
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PersonaAgent:
     """
     Wraps the Claude API with a persona's system prompt.
@@ -36,6 +247,8 @@ class PersonaAgent:
         system_prompt: The system prompt defining agent behavior
         client: Anthropic client instance (None in mock mode)
         mock_mode: If True, returns templated responses without API calls
+        async_client: AsyncAnthropic client instance used by the async methods
+        cache: Optional ResponseCache consulted before each API call
     """
 
     cluster_id: int
@@ -44,6 +257,49 @@ class PersonaAgent:
     client: Any = None
     mock_mode: bool = False
     model: str = "claude-sonnet-4-20250514"
+    async_client: Any = None
+    cache: ResponseCache | None = None
+
+    # Persona-specific mock responses based on key traits
+    # Literals containing spaces are not interned automatically, so the keys
+    # are interned explicitly to match interned persona names by identity
+    _MOCK_TEMPLATES: ClassVar[dict[str, str]] = {
+        sys.intern(name): text for name, text in {
+            "Mainstream Shopper": (
+                "As a typical weekday shopper, I'd consider this purchase carefully. "
+                "I usually buy what I need and move on. Given this scenario, I'd likely "
+                "proceed if it meets my specific need and the price is reasonable."
+            ),
+            "Weekend Buyer": (
+                "I typically browse on weekends when I have time. This seems interesting, "
+                "but I'd want to think it over during my weekend shopping time."
+            ),
+            "Cash Customer": (
+                "I prefer to pay upfront with boleto. If this requires installments or "
+                "credit, I'd hesitate. I don't like carrying debt for purchases."
+            ),
+            "High-Value Financing Shopper": (
+                "I'm comfortable with larger purchases when I can spread payments. "
+                "If 10x installments are available, the monthly cost matters more than total price."
+            ),
+            "Bulk Buyer": (
+                "I prefer to bundle purchases together. If there's a deal for buying multiple, "
+                "I'd be more interested. Single items feel less efficient to me."
+            ),
+            "Loyal Explorer Customer": (
+                "I'm always open to trying new categories. As a repeat customer, I trust this "
+                "marketplace and would consider exploring this option."
+            ),
+            "Critical Shopper": (
+                "I have high standards. Before deciding, I'd want to see the reviews carefully. "
+                "If there are quality concerns, I'd pass regardless of the price."
+            )
+        }.items()
+    }
+
+    def __post_init__(self):
+        """Intern persona_name so _MOCK_TEMPLATES lookups match by identity."""
+        self.persona_name = sys.intern(self.persona_name)
 
     @classmethod
     def from_persona_data(
@@ -51,7 +307,9 @@ class PersonaAgent:
         persona_data: dict,
         client: Any = None,
         mock_mode: bool = False,
-        model: str = "claude-sonnet-4-20250514"
+        model: str = "claude-sonnet-4-20250514",
+        async_client: Any = None,
+        cache: ResponseCache | None = None
     ) -> PersonaAgent:
         """Create a PersonaAgent from persona dictionary."""
         return cls(
@@ -60,7 +318,9 @@ class PersonaAgent:
             system_prompt=persona_data["agent_system_prompt"],
             client=client,
             mock_mode=mock_mode,
-            model=model
+            model=model,
+            async_client=async_client,
+            cache=cache
         )
 
     def respond(self, scenario: str, max_tokens: int = 500) -> str:
@@ -77,25 +337,91 @@ class PersonaAgent:
         if self.mock_mode:
             return self._mock_response(scenario)
 
+        cache_key = self._cache_key(scenario, max_tokens)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        self._check_client(self.client)
+
+        message = self.client.messages.create(
+            **self._request_kwargs(scenario, max_tokens)
+        )
+        text = message.content[0].text
+
+        if cache_key is not None:
+            self.cache.put(cache_key, text)
+
+        return text
+
+    async def arespond(self, scenario: str, max_tokens: int = 500) -> str:
+        """
+        Async version of respond() using the AsyncAnthropic client.
+
+        Args:
+            scenario: The scenario or question to respond to
+            max_tokens: Maximum response length
+
+        Returns:
+            The agent's response as this persona
+        """
+        if self.mock_mode:
+            return self._mock_response(scenario)
+
+        cache_key = self._cache_key(scenario, max_tokens)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        self._check_client(self.async_client)
+
+        message = await self.async_client.messages.create(
+            **self._request_kwargs(scenario, max_tokens)
+        )
+        text = message.content[0].text
+
+        if cache_key is not None:
+            self.cache.put(cache_key, text)
+
+        return text
+
+    def _cache_key(self, scenario: str, max_tokens: int) -> str | None:
+        """Return the response cache key for a scenario, or None if caching is off."""
+        if self.cache is None:
+            return None
+        return ResponseCache.make_key(
+            self.system_prompt, scenario, self.model, max_tokens
+        )
+
+    def _check_client(self, client: Any) -> None:
+        """Raise if the API cannot be called with the given client."""
         if not ANTHROPIC_AVAILABLE:
             raise ImportError(
                 "anthropic package not installed. "
                 "Run: pip install anthropic"
             )
 
-        if self.client is None:
+        if client is None:
             raise ValueError(
                 "No Anthropic client provided. Either pass a client or use mock_mode=True"
             )
 
-        message = self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            system=self.system_prompt,
-            messages=[{"role": "user", "content": scenario}]
-        )
-
-        return message.content[0].text
+    def _request_kwargs(self, scenario: str, max_tokens: int) -> dict:
+        """Build the messages.create() arguments shared by sync and async calls."""
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            # Mark the static persona prompt cacheable so repeated calls only
+            # pay full input cost for the scenario
+            "system": [{
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }],
+            "messages": [{"role": "user", "content": scenario}]
+        }
 
     def respond_with_decision(
         self,
@@ -110,17 +436,45 @@ class PersonaAgent:
             max_tokens: Maximum response length
 
         Returns:
-            Dictionary with 'decision', 'reasoning', and 'raw_response'
+            Dictionary with 'decision', 'reasoning', and 'raw_response'.
+            If the API call fails transiently (rate limit, overload, outage),
+            'decision' is "Error" and 'raw_response' holds the error message;
+            other API errors are raised.
         """
-        structured_prompt = f"""{scenario}
+        try:
+            raw_response = self.respond(self._structured_prompt(scenario), max_tokens)
+        except _API_ERRORS as e:
+            if not _is_transient(e):
+                raise
+            return self._error_result(e)
+        return self._decision_result(raw_response)
+
+    async def arespond_with_decision(
+        self,
+        scenario: str,
+        max_tokens: int = 500
+    ) -> dict:
+        """Async version of respond_with_decision()."""
+        try:
+            raw_response = await self.arespond(self._structured_prompt(scenario), max_tokens)
+        except _API_ERRORS as e:
+            if not _is_transient(e):
+                raise
+            return self._error_result(e)
+        return self._decision_result(raw_response)
+
+    @staticmethod
+    def _structured_prompt(scenario: str) -> str:
+        """Append the decision/reasoning instructions to a scenario."""
+        return f"""{scenario}
 
 Please respond with:
 1. DECISION: [Yes/No/Maybe] - Would you make this purchase?
 2. REASONING: Brief explanation of your decision (2-3 sentences)
 3. KEY FACTORS: What were the most important factors in your decision?"""
 
-        raw_response = self.respond(structured_prompt, max_tokens)
-
+    def _decision_result(self, raw_response: str) -> dict:
+        """Package a raw structured response with its parsed decision."""
         # Parse the response (basic extraction)
         decision = self._extract_decision(raw_response)
 
@@ -131,70 +485,45 @@ Please respond with:
             "raw_response": raw_response
         }
 
+    def _error_result(self, error: Exception) -> dict:
+        """Build the result recorded when an API call fails transiently after retries."""
+        logger.warning("API call failed for %s: %s", self.persona_name, error)
+        return {
+            "persona_name": self.persona_name,
+            "cluster_id": self.cluster_id,
+            "decision": "Error",
+            "raw_response": str(error)
+        }
+
     def _extract_decision(self, response: str) -> str:
         """Extract decision from structured response."""
-        import re
-        response_lower = response.lower()
+        # Patterns are case-insensitive, so only the matched word is lowercased
+        head = response[:_DECISION_SEARCH_CHARS]
 
-        # Look for explicit decision markers (handles markdown bold, brackets, etc.)
-        # Matches: "DECISION: Yes", "**DECISION:** No", "DECISION: [Maybe]", etc.
-        decision_pattern = r'\*{0,2}decision\*{0,2}[:\s]+\[?(\w+)\]?'
-        match = re.search(decision_pattern, response_lower)
+        match = _DECISION_RE.search(head)
 
         if match:
-            decision = match.group(1)
-            if decision in ('yes', 'y'):
+            decision = match.group(1).lower()
+            if decision in _YES:
                 return "Yes"
-            elif decision in ('no', 'n'):
+            elif decision in _NO:
                 return "No"
-            elif decision in ('maybe', 'uncertain', 'unsure'):
+            elif decision in _MAYBE:
                 return "Maybe"
 
         # Fallback: look for keywords in first 200 chars
-        first_part = response_lower[:200]
-        if "i would buy" in first_part or "i'll take" in first_part or "yes," in first_part:
+        # ("yes" phrases take precedence over "no" phrases)
+        matches = _FALLBACK_RE.findall(head[:200])
+        if any(yes for yes, _ in matches):
             return "Yes"
-        elif "i would not" in first_part or "i wouldn't" in first_part or "no," in first_part:
+        elif matches:
             return "No"
 
         return "Unclear"
 
     def _mock_response(self, scenario: str) -> str:
         """Generate a mock response for testing without API."""
-        # Persona-specific mock responses based on key traits
-        mock_templates = {
-            "Mainstream Shopper": (
-                "As a typical weekday shopper, I'd consider this purchase carefully. "
-                "I usually buy what I need and move on. Given this scenario, I'd likely "
-                "proceed if it meets my specific need and the price is reasonable."
-            ),
-            "Weekend Buyer": (
-                "I typically browse on weekends when I have time. This seems interesting, "
-                "but I'd want to think it over during my weekend shopping time."
-            ),
-            "Cash Customer": (
-                "I prefer to pay upfront with boleto. If this requires installments or "
-                "credit, I'd hesitate. I don't like carrying debt for purchases."
-            ),
-            "High-Value Financing Shopper": (
-                "I'm comfortable with larger purchases when I can spread payments. "
-                "If 10x installments are available, the monthly cost matters more than total price."
-            ),
-            "Bulk Buyer": (
-                "I prefer to bundle purchases together. If there's a deal for buying multiple, "
-                "I'd be more interested. Single items feel less efficient to me."
-            ),
-            "Loyal Explorer Customer": (
-                "I'm always open to trying new categories. As a repeat customer, I trust this "
-                "marketplace and would consider exploring this option."
-            ),
-            "Critical Shopper": (
-                "I have high standards. Before deciding, I'd want to see the reviews carefully. "
-                "If there are quality concerns, I'd pass regardless of the price."
-            )
-        }
-
-        base_response = mock_templates.get(
+        base_response = self._MOCK_TEMPLATES.get(
             self.persona_name,
             f"[Mock response for {self.persona_name}] Considering the scenario..."
         )
@@ -214,7 +543,10 @@ class PersonaSimulator:
         self,
         personas_path: str | Path = None,
         mock_mode: bool = False,
-        model: str = "claude-sonnet-4-20250514"
+        model: str = "claude-sonnet-4-20250514",
+        cache: ResponseCache | None = None,
+        use_cache: bool = True,
+        http_backend: Literal["httpx", "aiohttp"] = "aiohttp"
     ):
         """
         Initialize the simulator.
@@ -223,7 +555,15 @@ class PersonaSimulator:
             personas_path: Path to personas.json. If None, uses default location.
             mock_mode: If True, all agents use mock responses
             model: Claude model to use for API calls
+            cache: ResponseCache to use. If None, uses the default cache file.
+            use_cache: If False, every call goes to the API and nothing is cached
+            http_backend: HTTP transport for the async client ("aiohttp" or "httpx")
         """
+        if http_backend not in ("httpx", "aiohttp"):
+            raise ValueError(
+                f"Unknown http_backend {http_backend!r}. Use 'httpx' or 'aiohttp'"
+            )
+
         if personas_path is None:
             # Default path relative to this file
             personas_path = Path(__file__).parent.parent / "data/processed/personas.json"
@@ -231,14 +571,32 @@ class PersonaSimulator:
         self.personas_path = Path(personas_path)
         self.mock_mode = mock_mode
         self.model = model
+        self.http_backend = http_backend
+        if not use_cache:
+            cache = None
+        elif cache is None:
+            cache = ResponseCache()
+        self.cache = cache
         self.personas_data: dict = {}
         self.agents: dict[int, PersonaAgent] = {}
+        # Agents ordered by cluster_id; see _agents_in_order()
+        self._sorted_agents: list[tuple[int, PersonaAgent]] = []
         self._client = None
+        self._async_client = None
+        self._async_client_loop = None
 
     def load_personas(self) -> dict:
         """Load personas from JSON file."""
-        with open(self.personas_path, "r") as f:
-            data = json.load(f)
+        with open(self.personas_path, "rb") as f:
+            raw = f.read()
+        try:
+            data = _loads(raw)
+        except json.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens json.dump writes for
+            # float stats; the stdlib parser accepts them
+            if _loads is json.loads:
+                raise
+            data = json.loads(raw)
 
         self.personas_data = data
         return data
@@ -249,22 +607,83 @@ class PersonaSimulator:
             return None
 
         if self._client is None:
-            if not ANTHROPIC_AVAILABLE:
-                raise ImportError(
-                    "anthropic package not installed. "
-                    "Run: pip install anthropic"
-                )
+            self._client = anthropic.Anthropic(
+                api_key=self._get_api_key(),
+                max_retries=_MAX_RETRIES,
+                timeout=_TIMEOUT
+            )
 
-            api_key = os.environ.get("ANTHROPIC_API_KEY")
-            if not api_key:
-                raise ValueError(
-                    "ANTHROPIC_API_KEY not found in environment. "
-                    "Set it or use mock_mode=True"
-                )
+        return self._client
 
-            self._client = anthropic.Anthropic(api_key=api_key)
+    def _get_async_client(self):
+        """
+        Get or create an AsyncAnthropic client for the running event loop.
 
-        return self._client
+        Async clients hold connections bound to the loop that created them,
+        so a new client is created whenever a new event loop is in use.
+        """
+        if self.mock_mode:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            client_kwargs = {
+                "api_key": self._get_api_key(),
+                "max_retries": _MAX_RETRIES,
+                "timeout": _TIMEOUT
+            }
+
+            if self.http_backend == "aiohttp":
+                # Older SDKs lack DefaultAioHttpClient; newer ones raise
+                # RuntimeError when the aiohttp extra is not installed
+                try:
+                    client_kwargs["http_client"] = anthropic.DefaultAioHttpClient()
+                except (AttributeError, RuntimeError) as e:
+                    raise ImportError(
+                        "aiohttp backend not installed. "
+                        "Run: pip install 'anthropic[aiohttp]>=0.55.0' or use http_backend='httpx'"
+                    ) from e
+
+            self._async_client = anthropic.AsyncAnthropic(**client_kwargs)
+            self._async_client_loop = loop
+
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async client, if one has been created, and detach it from the agents."""
+        client = self._async_client
+        self._async_client = None
+        self._async_client_loop = None
+
+        for agent in self.agents.values():
+            agent.async_client = None
+
+        if client is not None:
+            await client.close()
+
+    async def _closing(self, coro):
+        """Await coro, then close the async client before its event loop ends."""
+        try:
+            return await coro
+        finally:
+            await self.aclose()
+
+    def _get_api_key(self) -> str:
+        """Read the API key from the environment, checking anthropic is installed."""
+        if not ANTHROPIC_AVAILABLE:
+            raise ImportError(
+                "anthropic package not installed. "
+                "Run: pip install anthropic"
+            )
+
+        api_key = os.environ.get("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "ANTHROPIC_API_KEY not found in environment. "
+                "Set it or use mock_mode=True"
+            )
+
+        return api_key
 
     def initialize_agents(self) -> dict[int, PersonaAgent]:
         """
@@ -286,15 +705,40 @@ class PersonaSimulator:
                 persona_data,
                 client=client,
                 mock_mode=self.mock_mode,
-                model=self.model
+                model=self.model,
+                cache=self.cache
             )
 
+        self._sorted_agents = sorted(self.agents.items())
+
         return self.agents
 
     def run_scenario(self, scenario: str, structured: bool = True) -> pd.DataFrame:
         """
         Run a single scenario across all personas.
 
+        Synchronous wrapper around arun_scenario(). The async client it
+        creates is closed before returning.
+
+        Args:
+            scenario: The scenario text to present to each persona
+            structured: If True, use respond_with_decision for parsed output
+
+        Returns:
+            DataFrame with columns: cluster_id, persona_name, decision, response
+        """
+        return _run_sync(self._closing(
+            self.arun_scenario(scenario, structured=structured)
+        ))
+
+    async def arun_scenario(
+        self,
+        scenario: str,
+        structured: bool = True
+    ) -> pd.DataFrame:
+        """
+        Run a single scenario across all personas concurrently.
+
         Args:
             scenario: The scenario text to present to each persona
             structured: If True, use respond_with_decision for parsed output
@@ -302,70 +746,246 @@ class PersonaSimulator:
         Returns:
             DataFrame with columns: cluster_id, persona_name, decision, response
         """
+        import pandas as pd
+
         if not self.agents:
             self.initialize_agents()
 
-        results = []
-
-        for cluster_id, agent in sorted(self.agents.items()):
-            if structured:
-                result = agent.respond_with_decision(scenario)
-                results.append({
-                    "cluster_id": cluster_id,
-                    "persona_name": result["persona_name"],
-                    "decision": result["decision"],
-                    "response": result["raw_response"]
-                })
-            else:
-                response = agent.respond(scenario)
-                results.append({
-                    "cluster_id": cluster_id,
-                    "persona_name": agent.persona_name,
-                    "decision": None,
-                    "response": response
-                })
-
-        return pd.DataFrame(results)
+        self._bind_async_client()
+        agents = self._agents_in_order()
+
+        responses = await _gather_or_cancel([
+            self._arespond(agent, scenario, structured) for _, agent in agents
+        ])
+
+        columns = {name: [] for name in _RESULT_COLUMNS}
+        for (cluster_id, agent), response in zip(agents, responses):
+            _append_row(columns, (cluster_id, *self._response_fields(agent, response)))
+
+        return pd.DataFrame(columns)
+
+    def _agents_in_order(self) -> list[tuple[int, PersonaAgent]]:
+        """
+        Return (cluster_id, agent) pairs ordered by cluster_id.
+
+        The sorted list is reused across scenarios and rebuilt only when
+        self.agents no longer holds exactly the same agents.
+        """
+        if len(self._sorted_agents) != len(self.agents) or any(
+            self.agents.get(cluster_id) is not agent
+            for cluster_id, agent in self._sorted_agents
+        ):
+            self._sorted_agents = sorted(self.agents.items())
+
+        return self._sorted_agents
+
+    def _bind_async_client(self) -> None:
+        """Attach the async client for the running event loop to every agent."""
+        client = self._get_async_client()
+        for agent in self.agents.values():
+            agent.async_client = client
+
+    @staticmethod
+    async def _arespond(
+        agent: PersonaAgent,
+        scenario: str,
+        structured: bool
+    ) -> str | dict:
+        """Get one agent's response, recording API failures as an error result."""
+        if structured:
+            return await agent.arespond_with_decision(scenario)
+
+        try:
+            return await agent.arespond(scenario)
+        except _API_ERRORS as e:
+            if not _is_transient(e):
+                raise
+            return agent._error_result(e)
+
+    @staticmethod
+    def _response_fields(agent: PersonaAgent, response: str | dict) -> tuple:
+        """Return (persona_name, decision, response text) for an agent response."""
+        # Structured and error results are dicts; plain responses are text
+        if isinstance(response, dict):
+            return (
+                response["persona_name"],
+                response["decision"],
+                response["raw_response"]
+            )
+
+        return (agent.persona_name, None, response)
 
     def run_batch(
         self,
         scenarios: list[dict],
-        structured: bool = True
+        structured: bool = True,
+        concurrency_limit: int = 20,
+        output_jsonl: str | Path | None = None,
+        resume: bool = True
     ) -> pd.DataFrame:
         """
         Run multiple scenarios across all personas.
 
+        Synchronous wrapper around arun_batch(). The async client it
+        creates is closed before returning.
+
         Args:
             scenarios: List of dicts with 'name' and 'text' keys
             structured: If True, use respond_with_decision for parsed output
+            concurrency_limit: Maximum number of API calls in flight at once
+            output_jsonl: If given, stream each result row to this JSONL file
+            resume: If True, skip rows already present in output_jsonl
 
         Returns:
             DataFrame with columns: scenario_name, cluster_id, persona_name, decision, response
         """
-        all_results = []
+        return _run_sync(self._closing(self.arun_batch(
+            scenarios,
+            structured=structured,
+            concurrency_limit=concurrency_limit,
+            output_jsonl=output_jsonl,
+            resume=resume
+        )))
+
+    async def arun_batch(
+        self,
+        scenarios: list[dict],
+        structured: bool = True,
+        concurrency_limit: int = 20,
+        output_jsonl: str | Path | None = None,
+        resume: bool = True
+    ) -> pd.DataFrame:
+        """
+        Run multiple scenarios across all personas concurrently.
+
+        Every (scenario, persona) pair is dispatched as one job, with at most
+        concurrency_limit API calls in flight at once. When output_jsonl is
+        given, rows are written to it as they complete, so an interrupted
+        batch can be resumed from the rows already on disk.
 
+        Args:
+            scenarios: List of dicts with 'name' and 'text' keys
+            structured: If True, use respond_with_decision for parsed output
+            concurrency_limit: Maximum number of API calls in flight at once
+            output_jsonl: If given, stream each result row to this JSONL file.
+                Scenario names must then be unique.
+            resume: If True, skip rows already present in output_jsonl;
+                if False, overwrite the file
+
+        Returns:
+            DataFrame with columns: scenario_name, cluster_id, persona_name, decision, response
+        """
+        import pandas as pd
+
+        if concurrency_limit < 1:
+            raise ValueError(
+                f"concurrency_limit must be at least 1, got {concurrency_limit}"
+            )
+
+        if output_jsonl is not None:
+            # Checkpoint rows are matched to jobs by (scenario_name, cluster_id)
+            name_counts = Counter(scenario.get("name", "unnamed") for scenario in scenarios)
+            duplicates = sorted(name for name, count in name_counts.items() if count > 1)
+            if duplicates:
+                raise ValueError(
+                    "Scenario names must be unique when output_jsonl is set; "
+                    f"duplicated: {', '.join(duplicates)}"
+                )
+
+        if not self.agents:
+            self.initialize_agents()
+
+        self._bind_async_client()
+        jobs = [
+            (scenario.get("name", "unnamed"), scenario["text"], cluster_id, agent)
+            for scenario in scenarios
+            for cluster_id, agent in self._agents_in_order()
+        ]
+
+        async def _run_job(job: tuple) -> tuple:
+            """Run one job, returning its row values ordered as _BATCH_COLUMNS."""
+            scenario_name, scenario_text, cluster_id, agent = job
+            response = await self._arespond(agent, scenario_text, structured)
+            return (cluster_id, *self._response_fields(agent, response), scenario_name)
+
+        columns = {name: [] for name in _BATCH_COLUMNS}
+
+        if output_jsonl is None:
+            sem = asyncio.Semaphore(concurrency_limit)
+
+            async def _one(job: tuple) -> tuple:
+                async with sem:
+                    return await _run_job(job)
+
+            for values in await _gather_or_cancel([_one(job) for job in jobs]):
+                _append_row(columns, values)
+            return pd.DataFrame(columns)
+
+        output_jsonl = Path(output_jsonl)
+        batch_keys = {(job[0], job[2]) for job in jobs}
+
+        if resume and output_jsonl.exists():
+            _terminate_last_line(output_jsonl)
+            done = {
+                (row["scenario_name"], row["cluster_id"])
+                for row in _read_jsonl(output_jsonl)
+            }
+            jobs = [job for job in jobs if (job[0], job[2]) not in done]
+
+        # concurrency_limit workers pull jobs from a queue and write each row
+        # as it completes, so only in-flight responses are held in memory
+        queue: asyncio.Queue = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+
+        # Failed rows are returned but not checkpointed, so a resume retries them
+        errors = []
+
+        async def _worker(f) -> None:
+            while not queue.empty():
+                row = dict(zip(_BATCH_COLUMNS, await _run_job(queue.get_nowait())))
+                if row["decision"] == "Error":
+                    errors.append(row)
+                    continue
+                f.write(json.dumps(row) + "\n")
+                f.flush()
+
+        output_jsonl.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_jsonl, "a" if resume else "w") as f:
+            await _gather_or_cancel([
+                _worker(f) for _ in range(min(concurrency_limit, queue.qsize()))
+            ])
+
+        # Rebuild this batch's rows from disk in scenario order, then by cluster
+        scenario_order: dict[str, int] = {}
         for scenario in scenarios:
-            scenario_name = scenario.get("name", "unnamed")
-            scenario_text = scenario["text"]
+            scenario_order.setdefault(scenario.get("name", "unnamed"), len(scenario_order))
 
-            df = self.run_scenario(scenario_text, structured=structured)
-            df["scenario_name"] = scenario_name
-            all_results.append(df)
+        results = [
+            row for row in _read_jsonl(output_jsonl)
+            if (row["scenario_name"], row["cluster_id"]) in batch_keys
+        ] + errors
+        results.sort(key=lambda row: (scenario_order[row["scenario_name"]], row["cluster_id"]))
 
-        return pd.concat(all_results, ignore_index=True)
+        for row in results:
+            _append_row(columns, (row[name] for name in _BATCH_COLUMNS))
+
+        return pd.DataFrame(columns)
 
     def get_persona_summary(self) -> pd.DataFrame:
         """Get a summary of all loaded personas."""
+        import pandas as pd
+
         if not self.personas_data:
             self.load_personas()
 
-        summaries = []
-        for cluster_id_str, persona in self.personas_data["personas"].items():
-            summaries.append({
-                "cluster_id": int(cluster_id_str),
-                "persona_name": persona["persona_name"],
-                "size": persona["size"],
-                "percentage": f"{persona['percentage']:.1f}%"
-            })
+        personas = self.personas_data["personas"]
+
+        summary = pd.DataFrame({
+            "cluster_id": [int(cluster_id_str) for cluster_id_str in personas],
+            "persona_name": [persona["persona_name"] for persona in personas.values()],
+            "size": [persona["size"] for persona in personas.values()],
+            "percentage": [f"{persona['percentage']:.1f}%" for persona in personas.values()]
+        })
 
-        return pd.DataFrame(summaries).sort_values("cluster_id")
+        return summary.sort_values("cluster_id")